@@ -478,6 +478,7 @@ rule add_demand:
     params:
         sectors=config["scenario"]["sector"],
         planning_horizons=config["scenario"]["planning_horizons"],
+        cache=RESOURCES + "{interconnect}/demand_cache",
     input:
         network=RESOURCES + "{interconnect}/elec_base_network.nc",
         demand=demand_to_add,
@@ -487,6 +488,7 @@ rule add_demand:
         LOGS + "{interconnect}/add_demand.log",
     benchmark:
         BENCHMARKS + "{interconnect}/add_demand"
+    threads: 2
     resources:
         mem_mb=interconnect_mem,
     script:
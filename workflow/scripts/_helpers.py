@@ -8,6 +8,7 @@ import re
 from functools import partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 import yaml
@@ -15,6 +16,9 @@ from snakemake.utils import update_config
 
 REGION_COLS = ["geometry", "name", "x", "y", "country"]
 
+# use the libyaml parser when PyYAML was built against it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def configure_logging(snakemake, skip_handlers=False):
     """
@@ -146,10 +150,15 @@ def calculate_annuity(n, r):
     discount rate of r, e.g. annuity(20, 0.05) * 20 = 1.6
     """
     if isinstance(r, pd.Series):
-        return pd.Series(1 / n, index=r.index).where(
-            r == 0,
-            r / (1.0 - 1.0 / (1.0 + r) ** n),
-        )
+        r_arr = r.to_numpy(dtype=float)
+        n_arr = np.asarray(n, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            annuity = np.where(
+                r_arr == 0,
+                1.0 / n_arr,
+                r_arr / (1.0 - (1.0 + r_arr) ** -n_arr),
+            )
+        return pd.Series(annuity, index=r.index)
     elif r > 0:
         return r / (1.0 - 1.0 / (1.0 + r) ** n)
     else:
@@ -549,13 +558,13 @@ def set_scenario_config(snakemake):
     if scenario.get("enable") and "run" in snakemake.wildcards.keys():
         try:
             with open(scenario["file"]) as f:
-                scenario_config = yaml.safe_load(f)
+                scenario_config = yaml.load(f, Loader=YAML_LOADER)
         except FileNotFoundError:
             # fallback for mock_snakemake
             script_dir = Path(__file__).parent.resolve()
             root_dir = script_dir.parent
             with open(root_dir / scenario["file"]) as f:
-                scenario_config = yaml.safe_load(f)
+                scenario_config = yaml.load(f, Loader=YAML_LOADER)
         update_config(snakemake.config, scenario_config[snakemake.wildcards.run])
 
 
@@ -780,7 +789,7 @@ def get_scenarios(run):
     if run["name"] and scenario_config.get("enable"):
         fn = Path(scenario_config["file"])
         if fn.exists():
-            scenarios = yaml.safe_load(fn.read_text())
+            scenarios = yaml.load(fn.read_text(), Loader=YAML_LOADER)
             if run["name"] == "all":
                 run["name"] = list(scenarios.keys())
             return scenarios
@@ -5,9 +5,16 @@ Depending on study, the load will all be aggregated to a single load
 type, or distributed to different sectors and end use fuels.
 """
 
+import hashlib
 import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pypsa
 from _helpers import configure_logging, mock_snakemake
@@ -15,24 +22,148 @@ from _helpers import configure_logging, mock_snakemake
 logger = logging.getLogger(__name__)
 
 
-def attach_demand(n: pypsa.Network, df: pd.DataFrame, carrier: str, suffix: str):
+SECTOR_MAPPER = {
+    "residential": "res",
+    "commercial": "com",
+    "industry": "ind",
+    "transport": "trn",
+}
+
+CARRIER_MAPPER = {
+    "electricity": "elec",
+    "heating": "heat",
+    "cooling": "cool",
+    "lpg": "lpg",
+    "space-heating": "space-heat",
+    "water-heating": "water-heat",
+}
+
+VEHICLE_MAPPER = {
+    "bus": "bus",
+    "heavy-duty": "hvy",
+    "light-duty": "lgt",
+    "med-duty": "med",
+    "air": "air-psg",
+    "rail-shipping": "rail-ship",
+    "rail-passenger": "rail-psg",
+    "boat-shipping": "boat-ship",
+}
+
+# (sector, end_use) or (sector, subsector, end_use) -> (carrier, suffix)
+DEMAND_CARRIERS = {
+    **{
+        (sector, end_use): (f"{sec}-{use}", f"-{sec}-{use}")
+        for sector, sec in SECTOR_MAPPER.items()
+        for end_use, use in CARRIER_MAPPER.items()
+    },
+    **{
+        (sector, subsector, end_use): (f"{sec}-{use}-{veh}", f"-{sec}-{use}-{veh}")
+        for sector, sec in SECTOR_MAPPER.items()
+        for subsector, veh in VEHICLE_MAPPER.items()
+        for end_use, use in CARRIER_MAPPER.items()
+    },
+}
+
+
+DEMAND_FILE_RE = re.compile(
+    r"(?P<sector>[^_/]+)_(?:(?P<subsector>[^_/]+)_)?(?P<end_use>[^_/.]+)\.\w+$",
+)
+
+# bump when the csv parsing changes, so previously cached frames are not reused
+DEMAND_CACHE_VERSION = 1
+
+
+def _scan_csv(path: Path) -> tuple[str, int]:
+    """
+    Returns a content hash and the number of data rows of a csv file.
+
+    Blank lines are not counted, as the csv parser skips them.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    rows = -1  # header
+    with open(path, "rb") as f:
+        for line in f:
+            digest.update(line)
+            if line.strip():
+                rows += 1
+    return digest.hexdigest(), rows
+
+
+def _load_demand(path: str, cache_dir: Path, n_rows: int) -> pd.DataFrame:
+    """
+    Reads a demand file, using a pickled copy of the parsed csv when available.
+
+    Parquet files are read directly with pyarrow. Csv row counts are checked
+    against ``n_rows`` before parsing. Csv pickles are stored in ``cache_dir``
+    keyed on the cache version, the pandas version and the content hash of
+    the csv. Pickles are written to a temporary file and moved into place, so
+    concurrent jobs never read a partial pickle.
+    """
+    csv = Path(path)
+    msg = f"Demand time series length in {path} does not match network snapshots"
+    if csv.suffix in (".parquet", ".pq"):
+        df = pd.read_parquet(csv, engine="pyarrow").astype(np.float32, copy=False)
+        assert len(df) == n_rows, msg
+        return df
+    content_hash, rows = _scan_csv(csv)
+    assert rows == n_rows, msg
+    prefix = f"{csv.stem}-v{DEMAND_CACHE_VERSION}-"
+    cache = cache_dir / f"{prefix}{pd.__version__}-{content_hash}.pkl"
+    try:
+        return pd.read_pickle(cache)
+    except FileNotFoundError:
+        pass
+    columns = pd.read_csv(csv, index_col=0, nrows=0).columns
+    df = pd.read_csv(
+        csv,
+        engine="pyarrow",
+        index_col=0,
+        dtype={c: "float32" for c in columns},
+    )
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=prefix, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_pickle(tmp, protocol=5)
+        os.replace(tmp, cache)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    # drop pickles of older versions of the same file
+    for stale in cache_dir.glob(f"{csv.stem}-v*.pkl"):
+        if stale != cache:
+            stale.unlink(missing_ok=True)
+    return df
+
+
+def attach_demand(n: pypsa.Network, demands: list[tuple[pd.DataFrame, str, str]]):
     """
     Add demand to network from specified configuration setting.
 
-    Returns network with demand added.
+    Each entry of ``demands`` is a ``(df, carrier, suffix)`` tuple. All
+    loads are added to the network in a single call.
     """
-    df.index = pd.to_datetime(df.index)
-    assert len(df.index) == len(
-        n.snapshots,
-    ), "Demand time series length does not match network snapshots"
-    df.index = n.snapshots
+    values = []
+    names = []
+    buses = []
+    carriers = []
+    for df, carrier, suffix in demands:
+        values.append(df.to_numpy(dtype=np.float32, copy=False))
+        names.append((df.columns.astype(str) + suffix).values)
+        buses.append(df.columns.values)
+        carriers.extend([carrier] * len(df.columns))
+    p_set = pd.DataFrame(
+        np.hstack(values),
+        index=n.snapshots,
+        columns=np.concatenate(names),
+        copy=False,
+    )
     n.madd(
         "Load",
-        df.columns,
-        suffix=suffix,
-        bus=df.columns,
-        p_set=df,
-        carrier=carrier,
+        p_set.columns,
+        bus=np.concatenate(buses),
+        p_set=p_set,
+        carrier=carriers,
     )
 
 
@@ -49,79 +180,60 @@ if __name__ == "__main__":
     if isinstance(demand_files, str):
         demand_files = [demand_files]
 
-    sector_mapper = {
-        "residential": "res",
-        "commercial": "com",
-        "industry": "ind",
-        "transport": "trn",
-    }
-
-    carrier_mapper = {
-        "electricity": "elec",
-        "heating": "heat",
-        "cooling": "cool",
-        "lpg": "lpg",
-        "space-heating": "space-heat",
-        "water-heating": "water-heat",
-    }
-
-    vehicle_mapper = {
-        "bus": "bus",
-        "heavy-duty": "hvy",
-        "light-duty": "lgt",
-        "med-duty": "med",
-        "air": "air-psg",
-        "rail-shipping": "rail-ship",
-        "rail-passenger": "rail-psg",
-        "boat-shipping": "boat-ship",
-    }
-
     if sectors == "E" or sectors == "":  # electricity only
 
         assert len(demand_files) == 1
 
-        suffix = ""
-        carrier = "AC"
-
-        df = pd.read_csv(demand_files[0], index_col=0)
-        attach_demand(n, df, carrier, suffix)
-        logger.info(f"Electricity demand added to network")
+        carriers = [("AC", "", "Electricity demand added to network")]
 
     else:  # sector files
 
+        carriers = []
         for demand_file in demand_files:
 
-            parsed_name = Path(demand_file).name.split("_")
-            parsed_name[-1] = parsed_name[-1].split(".csv")[0]
-
-            if len(parsed_name) == 2:
-
-                sector = parsed_name[0]
-                end_use = parsed_name[1]
-
-                carrier = f"{sector_mapper[sector]}-{carrier_mapper[end_use]}"
-                suffix = f"-{carrier}"
-
-                log_statement = f"{sector} {end_use} demand added to network"
-
-            elif len(parsed_name) == 3:
-
-                sector = parsed_name[0]
-                subsector = parsed_name[1]
-                end_use = parsed_name[2]
-
-                carrier = f"{sector_mapper[sector]}-{carrier_mapper[end_use]}-{vehicle_mapper[subsector]}"
-                suffix = f"-{carrier}"
-
-                log_statement = (
-                    f"{sector} {subsector} {end_use} demand added to network"
-                )
-
-            else:
+            match = DEMAND_FILE_RE.search(demand_file)
+            if not match:
                 raise NotImplementedError
+            parsed_name = tuple(name for name in match.groups() if name)
 
-            df = pd.read_csv(demand_file, index_col=0)
-            attach_demand(n, df, carrier, suffix)
-            logger.info(log_statement)
+            try:
+                carrier, suffix = DEMAND_CARRIERS[parsed_name]
+            except KeyError:
+                raise NotImplementedError
 
-    n.export_to_netcdf(snakemake.output.network)
+            log_statement = f"{' '.join(parsed_name)} demand added to network"
+
+            carriers.append((carrier, suffix, log_statement))
+
+    nprocesses = int(snakemake.threads)
+    with ThreadPoolExecutor(max_workers=nprocesses) as executor:
+        demands = [
+            (df, carrier, suffix)
+            for df, (carrier, suffix, _) in zip(
+                executor.map(
+                    partial(
+                        _load_demand,
+                        cache_dir=Path(snakemake.params.cache),
+                        n_rows=len(n.snapshots),
+                    ),
+                    demand_files,
+                ),
+                carriers,
+            )
+        ]
+
+    attach_demand(n, demands)
+    for _, _, log_statement in carriers:
+        logger.info(log_statement)
+
+    # parsed demand is copied into the network, free it before exporting
+    del demands
+
+    # shapes are not used by the workflow and inflate memory on netcdf export
+    if "Shape" in n.components and not n.shapes.empty:
+        n.mremove("Shape", n.shapes.index)
+
+    n.export_to_netcdf(
+        snakemake.output.network,
+        compression={"zlib": True, "complevel": 4},
+    )
@@ -38,7 +38,6 @@ Extendable generators are assigned a maximum capacity based on land-use constrai
 import logging
 import os
 import random
-from itertools import product
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
@@ -55,9 +54,6 @@ from _helpers import (
     test_network_datatype_consistency,
     update_p_nom_max,
 )
-from scipy import sparse
-from shapely.geometry import Point
-from shapely.prepared import prep
 from sklearn.neighbors import BallTree
 
 idx = pd.IndexSlice
@@ -117,18 +113,12 @@ def add_co2_emissions(n, costs, carriers):
     """
     Add CO2 emissions to the network's carriers attribute.
     """
-    suptechs = n.carriers.loc[carriers].index.str.split("-").str[0]
+    carrier_parts = pd.Series(carriers, index=carriers).str.split("-")
+    suptechs = carrier_parts.str[0]
     n.carriers.loc[carriers, "co2_emissions"] = costs.co2_emissions[suptechs].values
     if any("CCS" in carrier for carrier in carriers):
         ccs_factor = (
-            1
-            - pd.Series(carriers, index=carriers)
-            .str.split("-")
-            .str[1]
-            .str.replace("CCS", "")
-            .fillna(0)
-            .astype(int)
-            / 100
+            1 - carrier_parts.str[1].str.replace("CCS", "").fillna(0).astype(int) / 100
         )
         n.carriers.loc[ccs_factor.index, "co2_emissions"] *= ccs_factor
 
@@ -264,18 +254,20 @@ def update_transmission_costs(n, costs, length_factor=1.0):
     if n.links.loc[dc_b].empty:
         return
 
-    costs = (
-        n.links.loc[dc_b, "length"]
+    length, underwater_fraction = (
+        n.links.loc[dc_b, ["length", "underwater_fraction"]].to_numpy(dtype=float).T
+    )
+    n.links.loc[dc_b, "capital_cost"] = (
+        length
         * length_factor
         * (
-            (1.0 - n.links.loc[dc_b, "underwater_fraction"])
+            (1.0 - underwater_fraction)
             * costs.at["HVDC overhead", "annualized_capex_per_mw_km"]
-            + n.links.loc[dc_b, "underwater_fraction"]
+            + underwater_fraction
             * costs.at["HVDC submarine", "annualized_capex_per_mw_km"]
         )
         + costs.at["HVDC inverter pair", "annualized_capex_per_mw"]
     )
-    n.links.loc[dc_b, "capital_cost"] = costs
 
 
 def match_plant_to_bus(n, plants):
@@ -420,15 +412,13 @@ def attach_conventional_generators(
         marginal_cost=plants.marginal_cost,
         capital_cost=plants.annualized_capex_fom,
         build_year=plants.build_year.fillna(0).astype(int),
-        lifetime=plants.carrier.map(costs.cost_recovery_period_years),
+        lifetime=plants.cost_recovery_period_years,
         committable=unit_commitment,
         **committable_attrs,
     )
 
     # Add fuel and VOM costs to the network
-    n.generators.loc[plants.index, "vom_cost"] = plants.carrier.map(
-        costs.opex_variable_per_mwh,
-    )
+    n.generators.loc[plants.index, "vom_cost"] = plants.opex_variable_per_mwh
     n.generators.loc[plants.index, "fuel_cost"] = plants.fuel_cost
     n.generators.loc[plants.index, "heat_rate"] = plants.heat_rate_mmbtu_per_mwh
     n.generators.loc[plants.index, "ba_eia"] = plants.balancing_authority_code
@@ -452,6 +442,16 @@ def attach_wind_and_solar(
     network.
     """
     add_missing_carriers(n, carriers)
+
+    sub2bus = (
+        pd.read_csv(input_profiles.bus2sub, dtype=str)
+        .drop("interconnect", axis=1)
+        .rename(columns={"Bus": "bus_id"})
+        .drop_duplicates(subset="sub_id")
+        .set_index("sub_id")
+        .bus_id
+    )
+
     for car in carriers:
         if car == "hydro":
             continue
@@ -484,41 +484,18 @@ def attach_wind_and_solar(
             # else:
             capital_cost = costs.at[car, "annualized_capex_fom"]
 
-            bus2sub = (
-                pd.read_csv(input_profiles.bus2sub, dtype=str)
-                .drop("interconnect", axis=1)
-                .rename(columns={"Bus": "bus_id"})
-                .drop_duplicates(subset="sub_id")
-            )
-            bus_list = (
-                ds.bus.to_dataframe("sub_id").merge(bus2sub).bus_id.astype(str).values
-            )
-            p_nom_max_bus = (
-                ds["p_nom_max"]
-                .to_dataframe()
-                .merge(bus2sub[["bus_id", "sub_id"]], left_on="bus", right_on="sub_id")
-                .set_index("bus_id")
-                .p_nom_max
-            )
-            weight_bus = (
-                ds["weight"]
-                .to_dataframe()
-                .merge(bus2sub[["bus_id", "sub_id"]], left_on="bus", right_on="sub_id")
-                .set_index("bus_id")
-                .weight
-            )
-            bus_profiles = (
-                ds["profile"]
-                .transpose("time", "bus")
-                .to_pandas()
-                .T.merge(
-                    bus2sub[["bus_id", "sub_id"]],
-                    left_on="bus",
-                    right_on="sub_id",
-                )
-                .set_index("bus_id")
-                .drop(columns="sub_id")
-                .T
+            # only decode the profiles of substations that map onto a bus
+            subs = ds.indexes["bus"][ds.indexes["bus"].isin(sub2bus.index)]
+            bus_list = sub2bus[subs].astype(str).values
+            ds_bus = ds.sel(bus=subs)
+
+            p_nom_max_bus = pd.Series(ds_bus["p_nom_max"].values, index=bus_list)
+            weight_bus = pd.Series(ds_bus["weight"].values, index=bus_list)
+            bus_profiles = pd.DataFrame(
+                ds_bus["profile"].transpose("time", "bus").values,
+                index=ds_bus.indexes["time"],
+                columns=bus_list,
+                copy=False,
             )
             bus_profiles = broadcast_investment_horizons_index(n, bus_profiles)
 
@@ -739,21 +716,36 @@ def attach_breakthrough_renewable_plants(
         tech_plants.index = tech_plants.index.astype(str)
         logger.info(f"Adding {len(tech_plants)} {tech} generators to the network.")
 
-        p_nom_be = pd.read_csv(snakemake.input[f"{tech}_breakthrough"], index_col=0)
-
-        intersection = set(p_nom_be.columns).intersection(
-            tech_plants.index,
-        )  # filters by plants ID for the plants of type tech
-        p_nom_be = p_nom_be[list(intersection)]
+        # only parse the columns of plants of type tech
+        fn_profile = snakemake.input[f"{tech}_breakthrough"]
+        header = pd.read_csv(fn_profile, nrows=0).columns
+        usecols = [header[0], *header[1:][header[1:].isin(tech_plants.index)]]
+        p_nom_be = pd.read_csv(
+            fn_profile,
+            engine="pyarrow",
+            index_col=0,
+            usecols=usecols,
+        )
 
         p_nom_be.columns = p_nom_be.columns.astype(str)
 
         if (tech_plants.Pmax == 0).any():
             # p_nom is the maximum of {Pmax, dispatch}
-            p_nom = pd.concat([p_nom_be.max(axis=0), tech_plants["Pmax"]], axis=1).max(
-                axis=1,
+            p_nom = pd.Series(
+                np.fmax(
+                    p_nom_be.max(axis=0).reindex(tech_plants.index).to_numpy(),
+                    tech_plants["Pmax"].to_numpy(),
+                ),
+                index=tech_plants.index,
             )
-            p_max_pu = (p_nom_be[p_nom.index] / p_nom).fillna(0)  # some values remain 0
+            with np.errstate(invalid="ignore"):
+                p_max_pu = pd.DataFrame(
+                    p_nom_be[p_nom.index].to_numpy() / p_nom.to_numpy(),
+                    index=p_nom_be.index,
+                    columns=p_nom.index,
+                )
+            # some values remain 0
+            p_max_pu = p_max_pu.fillna(0)
         else:
             p_nom = tech_plants.Pmax
             p_max_pu = p_nom_be[tech_plants.index] / p_nom
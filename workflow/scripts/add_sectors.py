@@ -28,10 +28,19 @@ from build_stock_data import (
     get_transport_stock,
 )
 from build_transportation import apply_exogenous_ev_policy, build_transportation
-from constants import STATE_2_CODE, STATES_INTERCONNECT_MAPPER
-from shapely.geometry import Point
+from constants import CODE_2_STATE, STATE_2_CODE, STATES_INTERCONNECT_MAPPER
 
-CODE_2_STATE = {v: k for k, v in STATE_2_CODE.items()}
+INTERCONNECT_STATES = {
+    interconnect: frozenset(
+        state for state, ic in STATES_INTERCONNECT_MAPPER.items() if ic == interconnect
+    )
+    for interconnect in set(STATES_INTERCONNECT_MAPPER.values())
+}
+INTERCONNECT_STATES["usa"] = (
+    INTERCONNECT_STATES["western"]
+    | INTERCONNECT_STATES["eastern"]
+    | INTERCONNECT_STATES["texas"]
+)
 
 
 def assign_bus_2_state(
@@ -46,24 +55,29 @@ def assign_bus_2_state(
     The shapefile must be the counties shapefile
     """
 
-    buses = n.buses[["x", "y"]].copy()
-    buses["geometry"] = buses.apply(lambda x: Point(x.x, x.y), axis=1)
-    buses = gpd.GeoDataFrame(buses, crs="EPSG:4269")
+    buses = gpd.GeoDataFrame(
+        n.buses[["x", "y"]],
+        geometry=gpd.points_from_xy(n.buses.x, n.buses.y),
+        crs="EPSG:4269",
+    )
 
     states = gpd.read_file(shp).dissolve("STUSPS")["geometry"]
     states = gpd.GeoDataFrame(states)
     if states_2_include:
         states = states[states.index.isin(states_2_include)]
 
-    # project to avoid CRS warning from geopandas
-    buses_projected = buses.to_crs("EPSG:3857")
-    states_projected = states.to_crs("EPSG:3857")
+    # project to an equal area crs for distance based nearest matching
+    buses_projected = buses.to_crs("EPSG:5070")
+    states_projected = states.to_crs("EPSG:5070")
     gdf = gpd.sjoin_nearest(buses_projected, states_projected, how="left")
 
-    n.buses["STATE"] = n.buses.index.map(gdf.index_right)
+    # ties in sjoin_nearest return more than one state per bus
+    bus_states = gdf.index_right.groupby(level=0).first().reindex(n.buses.index)
+
+    n.buses["STATE"] = bus_states
 
     if state_2_state_name:
-        n.buses["STATE_NAME"] = n.buses.STATE.map(state_2_state_name)
+        n.buses["STATE_NAME"] = bus_states.map(state_2_state_name)
 
 
 def add_sector_foundation(
@@ -105,26 +119,16 @@ def add_sector_foundation(
 
     states = n.buses.STATE.dropna().unique()
 
-    zero_center_points = pd.DataFrame(
-        index=states,
-        columns=["x", "y"],
-        dtype=float,
-    ).fillna(0)
-    zero_center_points.index.name = "STATE"
-
+    # state center points, placed at zero if no center points are given
     if not center_points.empty:
-        points = center_points.loc[states].copy()
-        points = (
-            pd.concat([points, zero_center_points])
-            .reset_index(names=["STATE"])
-            .drop_duplicates(keep="first", subset="STATE")
-            .set_index("STATE")
-        )
+        points = center_points.loc[states, ["x", "y"]]
     else:
-        points = zero_center_points.copy()
-
-    points["name"] = points.index.map(CODE_2_STATE)
-    points["interconnect"] = points.index.map(STATES_INTERCONNECT_MAPPER)
+        points = pd.DataFrame(0.0, index=states, columns=["x", "y"])
+    points = points.assign(
+        name=points.index.map(CODE_2_STATE),
+        interconnect=points.index.map(STATES_INTERCONNECT_MAPPER),
+    )
+    points.index.name = "STATE"
 
     buses_to_create = [f"{x} {carrier}" for x in points.index]
     existing = n.buses[n.buses.index.isin(buses_to_create)].STATE.dropna().unique()
@@ -255,21 +259,24 @@ def split_loads_by_carrier(n: pypsa.Network):
     new link between the new bus and old bus if you want to retain the flow
     """
 
-    for bus in n.buses.index.unique():
-        df = n.loads[n.loads.bus == bus][["bus", "carrier"]]
+    df = n.loads[["bus", "carrier"]].join(
+        n.buses[["x", "y", "country", "interconnect", "STATE", "STATE_NAME"]],
+        on="bus",
+        how="inner",
+    )
 
-        n.madd(
-            "Bus",
-            df.index,
-            v_nom=1,
-            x=n.buses.at[bus, "x"],
-            y=n.buses.at[bus, "y"],
-            carrier=df.carrier,
-            country=n.buses.at[bus, "country"],
-            interconnect=n.buses.at[bus, "interconnect"],
-            STATE=n.buses.at[bus, "STATE"],
-            STATE_NAME=n.buses.at[bus, "STATE_NAME"],
-        )
+    n.madd(
+        "Bus",
+        df.index,
+        v_nom=1,
+        x=df.x,
+        y=df.y,
+        carrier=df.carrier,
+        country=df.country,
+        interconnect=df.interconnect,
+        STATE=df.STATE,
+        STATE_NAME=df.STATE_NAME,
+    )
 
     n.loads["bus"] = n.loads.index
 
@@ -351,18 +358,9 @@ if __name__ == "__main__":
 
     # map states to each clustered bus
 
-    if snakemake.wildcards.interconnect == "usa":
-        states_2_map = [
-            x
-            for x, y in STATES_INTERCONNECT_MAPPER.items()
-            if y in ("western", "eastern", "texas")
-        ]
-    else:
-        states_2_map = [
-            x
-            for x, y in STATES_INTERCONNECT_MAPPER.items()
-            if y == snakemake.wildcards.interconnect
-        ]
+    states_2_map = list(
+        INTERCONNECT_STATES.get(snakemake.wildcards.interconnect, frozenset()),
+    )
 
     assign_bus_2_state(n, snakemake.input.county, states_2_map, CODE_2_STATE)
 
@@ -50,7 +50,7 @@ import pypsa
 from _helpers import configure_logging, get_snapshots, test_network_datatype_consistency
 from build_shapes import load_na_shapes
 from geopandas.tools import sjoin
-from shapely.geometry import Point, Polygon
+from shapely.geometry import Polygon
 from sklearn.neighbors import BallTree
 
 
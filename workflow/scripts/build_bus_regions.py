@@ -31,6 +31,7 @@ import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pypsa
+import shapely
 from _helpers import REGION_COLS, configure_logging
 from scipy.spatial import Voronoi
 from shapely.geometry import Polygon
@@ -76,16 +77,18 @@ def voronoi_partition_pts(points, outline):
             ),
         )
 
-        polygons = []
-        for i in range(len(points)):
-            poly = Polygon(vor.vertices[vor.regions[vor.point_region[i]]])
-
-            if not poly.is_valid:
-                poly = poly.buffer(0)
+        polygons = np.array(
+            [
+                Polygon(vor.vertices[vor.regions[vor.point_region[i]]])
+                for i in range(len(points))
+            ],
+            dtype=object,
+        )
 
-            poly = poly.intersection(outline)
+        invalid = ~shapely.is_valid(polygons)
+        polygons[invalid] = shapely.buffer(polygons[invalid], 0)
 
-            polygons.append(poly)
+        polygons = shapely.intersection(polygons, outline)
 
     return np.array(polygons, dtype=object)
 
@@ -151,16 +154,15 @@ def main(snakemake):
     bus2sub_offshore = bus2sub[~bus2sub.Bus.isin(onshore_buses.index)]
 
     logger.info("Building Onshore Regions")
+    # substations of each region, grouped in a single pass over the substations
+    region_subs = bus2sub_onshore.groupby(f"{aggregation_zones}").groups
     for region in agg_region_shapes.index:
+        if region not in region_subs:
+            continue  # skip empty BA's which are not in the bus dataframe. ex. portions of eastern texas BA when using the WECC interconnect
         region_shape = agg_region_shapes[region]  # current shape
-        region_subs = bus2sub_onshore[f"{aggregation_zones}"][
-            bus2sub_onshore[f"{aggregation_zones}"] == region
-        ]  # series of substations in the current BA
         region_locs = all_locs.loc[
-            region_subs.index
+            region_subs[region]
         ]  # locations of substations in the current BA
-        if region_locs.empty:
-            continue  # skip empty BA's which are not in the bus dataframe. ex. portions of eastern texas BA when using the WECC interconnect
 
         if region == "MISO-0001":
             region_shape = (
@@ -181,28 +183,29 @@ def main(snakemake):
 
     ### Defining Offshore Regions ###
     logger.info("Building Offshore Regions")
-    for i in range(len(offshore_shapes)):
-        offshore_shape = offshore_shapes.iloc[i]
-        shape_name = offshore_shapes.index[i]
-        offshore_buses = bus2sub_offshore[["x", "y"]]
-        if offshore_buses.empty:
-            continue
-        offshore_regions_c = gpd.GeoDataFrame(
-            {
-                "name": offshore_buses.index,
-                "x": offshore_buses["x"],
-                "y": offshore_buses["y"],
-                "geometry": voronoi_partition_pts(
-                    offshore_buses.values,
-                    offshore_shape,
-                ),
-                "country": shape_name,
-            },
-        )
-        offshore_regions_c = offshore_regions_c.loc[
-            offshore_regions_c.area > 1e-2
-        ]  # remove extremely small regions
-        offshore_regions.append(offshore_regions_c)
+    # offshore substations are the same for every offshore shape
+    offshore_buses = bus2sub_offshore[["x", "y"]]
+    offshore_locs = offshore_buses.values
+    if not offshore_buses.empty:
+        for i in range(len(offshore_shapes)):
+            offshore_shape = offshore_shapes.iloc[i]
+            shape_name = offshore_shapes.index[i]
+            offshore_regions_c = gpd.GeoDataFrame(
+                {
+                    "name": offshore_buses.index,
+                    "x": offshore_buses["x"],
+                    "y": offshore_buses["y"],
+                    "geometry": voronoi_partition_pts(
+                        offshore_locs,
+                        offshore_shape,
+                    ),
+                    "country": shape_name,
+                },
+            )
+            offshore_regions_c = offshore_regions_c.loc[
+                offshore_regions_c.area > 1e-2
+            ]  # remove extremely small regions
+            offshore_regions.append(offshore_regions_c)
 
     onshore_regions_concat = pd.concat(onshore_regions, ignore_index=True)
 
@@ -210,13 +213,20 @@ def main(snakemake):
         ~onshore_regions_concat.geometry.is_empty
     ]  # removing few buses which don't have geometry
 
-    onshore_regions_concat.to_file(snakemake.output.regions_onshore)
+    onshore_regions_concat.to_file(
+        snakemake.output.regions_onshore,
+        engine="pyogrio",
+    )
     if offshore_regions:
         pd.concat(offshore_regions, ignore_index=True).to_file(
             snakemake.output.regions_offshore,
+            engine="pyogrio",
         )
     else:
-        offshore_shapes.to_frame().to_file(snakemake.output.regions_offshore)
+        offshore_shapes.to_frame().to_file(
+            snakemake.output.regions_offshore,
+            engine="pyogrio",
+        )
 
     if onshore_regions_concat[onshore_regions_concat.geometry.is_empty].shape[0] > 0:
         raise ValueError("Onshore Buses are missing geometry.")
@@ -7,6 +7,7 @@ from typing import Any, Optional
 
 import constants as const
 import duckdb
+import numpy as np
 import pandas as pd
 from _helpers import calculate_annuity
 from build_sector_costs import (
@@ -84,20 +85,41 @@ def load_pudl_aeo_data():
     return duckdb.query(query).to_df()
 
 
-def match_technology(row, tech_dict):
-    for key, value in tech_dict.items():
-        # Match technology and techdetail
-        if row["technology_description"] == value.get("technology") and row[
-            "technology_description_detail_1"
-        ] == value.get("techdetail"):
-            return key
-        # Match technology and techdetail2
-        elif row["technology_description"] == value.get("technology") and row[
-            "technology_description_detail_2"
-        ] == value.get("techdetail2"):
-            return key
+def match_technology(atb: pd.DataFrame, tech_dict: dict) -> pd.Series:
+    """
+    Maps ATB rows to pypsa technology names.
 
-    return None
+    Each entry in ``tech_dict`` matches on its technology and either its
+    techdetail or techdetail2. An entry without a techdetail (or
+    techdetail2) matches rows whose detail is None, as ``None == None``
+    did in the original row-wise comparison. If several entries match a
+    row, the entry that comes first in ``tech_dict`` wins.
+    """
+    missing = "<missing>"
+    techs = pd.DataFrame.from_dict(tech_dict, orient="index")
+    techs = techs.reindex(
+        columns=techs.columns.union(["techdetail", "techdetail2"], sort=False),
+    )
+    techs["position"] = range(len(techs))
+    positions = []
+    for detail, column in (
+        ("techdetail", "technology_description_detail_1"),
+        ("techdetail2", "technology_description_detail_2"),
+    ):
+        lookup = (
+            techs.assign(**{detail: techs[detail].fillna(missing)})
+            .drop_duplicates(["technology", detail])
+            .set_index(["technology", detail])["position"]
+        )
+        # only None (not NaN) compared equal to an absent mapper detail
+        values = atb[column].to_numpy(dtype=object)
+        values = np.where(np.equal(values, None), missing, values)
+        keys = pd.MultiIndex.from_arrays([atb["technology_description"], values])
+        positions.append(lookup.reindex(keys).to_numpy(dtype=float))
+    # position of the first matching entry for each row
+    first = pd.Series(np.fmin.reduce(positions), index=atb.index).dropna()
+    names = pd.Series(techs.index[first.to_numpy(dtype=int)], index=first.index)
+    return names.reindex(atb.index)
 
 
 def get_sector_costs(
@@ -220,22 +242,18 @@ if __name__ == "__main__":
 
     # Import PUDLs ATB data
     pudl_atb = load_pudl_atb_data()
-    pudl_atb["pypsa-name"] = pudl_atb.apply(
-        match_technology,
-        axis=1,
-        tech_dict=const.ATB_TECH_MAPPER,
-    )
+    pudl_atb["pypsa-name"] = match_technology(pudl_atb, const.ATB_TECH_MAPPER)
     pudl_atb = pudl_atb[pudl_atb["pypsa-name"].notnull()]
 
-    # Group by pypsa-name and filter for correct cost recovery period
+    # Filter for correct cost recovery period
+    crp = {
+        tech: params.get("crp", 30) for tech, params in const.ATB_TECH_MAPPER.items()
+    }
     pudl_atb = (
-        pudl_atb.groupby("pypsa-name")
-        .apply(
-            lambda x: x[
-                x["cost_recovery_period_years"]
-                == const.ATB_TECH_MAPPER[x.name].get("crp", 30)
-            ],
-        )
+        pudl_atb[
+            pudl_atb["cost_recovery_period_years"] == pudl_atb["pypsa-name"].map(crp)
+        ]
+        .sort_values("pypsa-name", kind="stable")
         .reset_index(drop=True)
     )
 
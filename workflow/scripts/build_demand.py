@@ -50,7 +50,7 @@ from eia import EnergyDemand, TransportationDemand
 logger = logging.getLogger(__name__)
 
 STATE_2_CODE = const.STATE_2_CODE
-CODE_2_STATE = {value: key for key, value in STATE_2_CODE.items()}
+CODE_2_STATE = const.CODE_2_STATE
 STATE_TIMEZONE = const.STATE_2_TIMEZONE
 
 FIPS_2_STATE = const.FIPS_2_STATE
@@ -1034,11 +1034,7 @@ class ReadCliu(ReadStrategy):
 
     @staticmethod
     def _norm_epri_data(data: pd.DataFrame) -> pd.DataFrame:
-        normed = []
-        for state in data.index.get_level_values("state").unique():
-            df = data.xs(state, level="state", drop_level=False)
-            normed.append(df.apply(lambda x: x / x.sum()))
-        return pd.concat(normed)
+        return data / data.groupby(level="state").transform("sum")
 
     @staticmethod
     def _add_lpg_epri(df: pd.DataFrame) -> pd.DataFrame:
@@ -160,7 +160,7 @@ class GasData(ABC):
     """
 
     state_2_interconnect = constants.STATES_INTERCONNECT_MAPPER
-    state_2_name = {v: k for k, v in constants.STATE_2_CODE.items()}
+    state_2_name = constants.CODE_2_STATE
     name_2_state = constants.STATE_2_CODE
     states_2_remove = [
         x for x, y in constants.STATES_INTERCONNECT_MAPPER.items() if not y
@@ -17,12 +17,10 @@ import pandas as pd
 import pypsa
 import yaml
 from build_heat import combined_heat
-from constants import STATE_2_CODE, STATES_CENSUS_DIVISION_MAPPER
+from constants import CODE_2_STATE, STATES_CENSUS_DIVISION_MAPPER
 from eia import TransportationFuelUse
 
 logger = logging.getLogger(__name__)
-
-CODE_2_STATE = {v: k for k, v in STATE_2_CODE.items()}
 """
 Hardcoded build years based on building year constructed starting from 2000
 https://www.eia.gov/consumption/commercial/data/2018/bc/pdf/b6.pdf
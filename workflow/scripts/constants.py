@@ -2,8 +2,6 @@
 Module for holding global constant values.
 """
 
-import pandas as pd
-
 ###########################################
 # Constants for GIS Coordinate Reference Systems
 ###########################################
@@ -196,15 +194,17 @@ ADS_FUEL_MAPPER = {
 ###############################
 
 # Extract only the continental united states
-STATES_TO_REMOVE = [
-    "Hawaii",
-    "Alaska",
-    "Commonwealth of the Northern Mariana Islands",
-    "United States Virgin Islands",
-    "Guam",
-    "Puerto Rico",
-    "American Samoa",
-]
+STATES_TO_REMOVE = frozenset(
+    (
+        "Hawaii",
+        "Alaska",
+        "Commonwealth of the Northern Mariana Islands",
+        "United States Virgin Islands",
+        "Guam",
+        "Puerto Rico",
+        "American Samoa",
+    ),
+)
 
 NERC_REGION_MAPPER = {
     "WECC": "western",
@@ -299,6 +299,10 @@ EIA_BA_2_REGION = {
     "YAD": "CAR",
 }
 
+EIA_BA_2_INTERCONNECT = {
+    ba: EIA_930_REGION_MAPPER.get(region) for ba, region in EIA_BA_2_REGION.items()
+}
+
 STATES_INTERCONNECT_MAPPER = {
     "AL": "eastern",
     "AK": None,
@@ -570,6 +574,8 @@ STATE_2_CODE = {
     "Mexico": "MX",
 }
 
+CODE_2_STATE = {v: k for k, v in STATE_2_CODE.items()}
+
 REEDS_NERC_INTERCONNECT_MAPPER = {
     "WECC_CA": "western",
     "WECC_NWPP": "western",
@@ -11,12 +11,7 @@ import seaborn as sns
 
 logger = logging.getLogger(__name__)
 from _helpers import configure_logging, get_snapshots
-from constants import (
-    EIA_930_REGION_MAPPER,
-    EIA_BA_2_REGION,
-    EIA_FUEL_MAPPER_2,
-    STATE_2_CODE,
-)
+from constants import CODE_2_STATE, EIA_BA_2_INTERCONNECT, EIA_FUEL_MAPPER_2
 from eia import ElectricPowerData, Emissions
 from plot_network_maps import (
     create_title,
@@ -638,7 +633,6 @@ def plot_state_emissions_historical_bar(
     )
     optimized["region"] = optimized.index.map(region_mapper)
     optimized = optimized.groupby("region").sum()
-    CODE_2_STATE = {v: k for k, v in STATE_2_CODE.items()}
     optimized.index = optimized.index.map(CODE_2_STATE)
     optimized.index.name = "state"
 
@@ -993,8 +987,8 @@ def main(snakemake):
     ge_all = ge_all.stack(level=0).swaplevel().sort_index(level=0)
     ge_all.columns = ge_all.columns.map(GE_carrier_names).fillna("Interchange")
 
-    ge_all["interconnect"] = (
-        ge_all.index.get_level_values(0).map(EIA_BA_2_REGION).map(EIA_930_REGION_MAPPER)
+    ge_all["interconnect"] = ge_all.index.get_level_values(0).map(
+        EIA_BA_2_INTERCONNECT,
     )
     ge_interchange = ge_all.loc[ge_all.interconnect.isna(), "Interchange"] / 1e3
     ge_all = ge_all.loc[~ge_all.interconnect.isna()]
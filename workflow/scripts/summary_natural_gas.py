@@ -8,7 +8,7 @@ import constants
 import pandas as pd
 import pypsa
 
-CODE_2_STATE = {v: k for k, v in constants.STATE_2_CODE.items()}
+CODE_2_STATE = constants.CODE_2_STATE
 
 
 def _rename_columns(df: pd.DataFrame) -> pd.DataFrame: